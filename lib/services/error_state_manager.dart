@@ -23,17 +23,18 @@ class DocumentError {
 
   /// Get a user-friendly error message
   String getUserFriendlyMessage() {
-    if (errorMessage.toLowerCase().contains('network')) {
+    final lowerError = errorMessage.toLowerCase();
+
+    if (lowerError.contains('network')) {
       return 'Network connection issue. Please check your internet connection and try again.';
-    } else if (errorMessage.toLowerCase().contains('authentication') ||
-        errorMessage.toLowerCase().contains('unauthorized')) {
+    } else if (lowerError.contains('authentication') ||
+        lowerError.contains('unauthorized')) {
       return 'Authentication issue. Please sign in again.';
-    } else if (errorMessage.toLowerCase().contains('version conflict')) {
+    } else if (lowerError.contains('version conflict')) {
       return 'Document was modified on another device. Please resolve the conflict.';
-    } else if (errorMessage.toLowerCase().contains('not found')) {
+    } else if (lowerError.contains('not found')) {
       return 'Document not found on server. It may have been deleted.';
-    } else if (errorMessage.toLowerCase().contains('storage') ||
-        errorMessage.toLowerCase().contains('space')) {
+    } else if (lowerError.contains('storage') || lowerError.contains('space')) {
       return 'Storage issue. Please check available space and try again.';
     } else {
       return 'Sync failed. Please try again later or contact support.';